@@ -5,6 +5,7 @@ from django.contrib import admin
 from django.urls import path, include
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
+    # App routes first (hot path); none of them overlap with admin/
     path('', include('routes.urls')),
+    path('admin/', admin.site.urls),
 ]
@@ -2,6 +2,7 @@
 Admin configuration for the Flight Routes System.
 """
 from django.contrib import admin
+from django.db.models import Q
 from .models import Airport, Route
 
 
@@ -15,17 +16,73 @@ class AirportAdmin(admin.ModelAdmin):
     readonly_fields = ['code']  # Code is primary key, shouldn't be changed after creation
 
 
+class AirportCodeListFilter(admin.SimpleListFilter):
+    """
+    Base list filter that matches a Route FK against an airport code.
+    
+    Airport.code is the primary key, so filtering on the FK column uses the
+    index directly without joining the airports table.
+    """
+    field_name = None
+    
+    def lookups(self, request, model_admin):
+        """List airports as (code, label) choices."""
+        return [
+            (code, f"{code} - {name}")
+            for code, name in Airport.objects.order_by('code').values_list('code', 'name')
+        ]
+    
+    def queryset(self, request, queryset):
+        """Filter routes by the selected airport code."""
+        if self.value():
+            return queryset.filter(**{f'{self.field_name}_id': self.value()})
+        return queryset
+
+
+class SourceCodeListFilter(AirportCodeListFilter):
+    """Filter routes by source airport code."""
+    title = 'source'
+    parameter_name = 'source'
+    field_name = 'source'
+
+
+class DestinationCodeListFilter(AirportCodeListFilter):
+    """Filter routes by destination airport code."""
+    title = 'destination'
+    parameter_name = 'destination'
+    field_name = 'destination'
+
+
 @admin.register(Route)
 class RouteAdmin(admin.ModelAdmin):
     """Admin interface for Route model."""
-    list_display = ['source', 'destination', 'distance', 'created_at']
-    list_filter = ['created_at', 'source', 'destination']
-    search_fields = ['source__code', 'source__name', 'destination__code', 'destination__name']
+    list_display = ['source_code', 'destination_code', 'distance', 'created_at']
+    list_filter = ['created_at', SourceCodeListFilter, DestinationCodeListFilter]
+    # Matched exactly against the indexed FK columns in get_search_results()
+    search_fields = ['source', 'destination']
+    search_help_text = "Search by exact source or destination airport code."
     ordering = ['-created_at']
     readonly_fields = ['created_at']
     
-    # Use select_related for efficient queries
-    def get_queryset(self, request):
-        """Optimize queryset with select_related."""
-        qs = super().get_queryset(request)
-        return qs.select_related('source', 'destination')
+    @admin.display(description='Source', ordering='source')
+    def source_code(self, obj):
+        """Source airport code, read from the FK column without a join."""
+        return obj.source_id
+    
+    @admin.display(description='Destination', ordering='destination')
+    def destination_code(self, obj):
+        """Destination airport code, read from the FK column without a join."""
+        return obj.destination_id
+    
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Find routes from or to the searched airport code.
+        
+        Codes are stored uppercase (airport_code_3upper), so the term is
+        upper-cased and compared with a plain equality that can use the
+        FK indexes, rather than the iexact lookup '=' search fields build.
+        """
+        term = search_term.strip().upper()
+        if not term:
+            return queryset, False
+        return queryset.filter(Q(source_id=term) | Q(destination_id=term)), False
@@ -0,0 +1,146 @@
+"""
+Airport caches for the Flight Routes System.
+
+Airports change rarely (admin-only writes), so the position-ordered airport
+list used by the Nth node search and the form dropdown choices are kept in
+Django's cache with a short timeout. Both are dropped once an Airport
+save/delete commits (see routes.signals); writes that fire no signals, such
+as bulk_create() or update(), are picked up when the timeout expires.
+
+The settings ship no CACHES, so Django's default LocMemCache keeps a copy
+per process and the commit-time clear only reaches the writing process.
+Other workers may serve the old airports until the timeout expires;
+configure a shared backend (e.g. Redis or Memcached) to avoid that.
+"""
+from bisect import bisect_left
+from collections import namedtuple
+from asgiref.local import Local
+from django.core.cache import cache
+from .models import Airport
+
+AirportEntry = namedtuple('AirportEntry', ['position', 'code', 'name'])
+
+# Cache key for the position-ordered airport list used by the Nth node search
+AIRPORT_POSITIONS_CACHE_KEY = 'airport_positions_v1'
+AIRPORT_POSITIONS_CACHE_TIMEOUT = 300  # seconds
+
+# Cache key for the airport dropdown choices
+AIRPORT_CHOICES_CACHE_KEY = 'airport_choices_v1'
+AIRPORT_CHOICES_CACHE_TIMEOUT = 300  # seconds
+
+# Per-request copy of the dropdown choices. Local() keeps it private to the
+# current thread/async context; `choices` only exists between request_started
+# and request_finished (see routes.signals).
+_request_state = Local()
+
+
+def _build_position_index():
+    """Build (positions, airports, index_by_code) sorted by position."""
+    airports = tuple(
+        AirportEntry(*row)
+        for row in Airport.objects.order_by('position').values_list('position', 'code', 'name')
+    )
+    positions = tuple(airport.position for airport in airports)
+    index_by_code = {airport.code: index for index, airport in enumerate(airports)}
+    return positions, airports, index_by_code
+
+
+def get_position_index(code=None):
+    """
+    Get one snapshot of the position-ordered airport list.
+    
+    Pass the same snapshot to several lookups so they agree with each other.
+    If ``code`` is given but missing from the cached snapshot (an airport
+    written without signals), the snapshot is rebuilt from the database once.
+    
+    Returns:
+        tuple: (positions, airports, index_by_code)
+    """
+    index = cache.get_or_set(
+        AIRPORT_POSITIONS_CACHE_KEY, _build_position_index, AIRPORT_POSITIONS_CACHE_TIMEOUT
+    )
+    if code is not None and code not in index[2]:
+        index = _build_position_index()
+        cache.set(AIRPORT_POSITIONS_CACHE_KEY, index, AIRPORT_POSITIONS_CACHE_TIMEOUT)
+    return index
+
+
+def get_airports_by_position():
+    """
+    Get all airports sorted by position.
+    
+    Returns:
+        tuple: AirportEntry(position, code, name) tuples
+    """
+    return get_position_index()[1]
+
+
+def find_airport_at_position(position, index=None):
+    """
+    Find the airport at the given position using binary search.
+    
+    Returns:
+        AirportEntry for the airport at that position, or None if no airport exists there
+    """
+    positions, airports, _ = index or get_position_index()
+    i = bisect_left(positions, position)
+    if i < len(positions) and positions[i] == position:
+        return airports[i]
+    return None
+
+
+def find_airport_by_code(code, index=None):
+    """
+    Find the airport with the given code.
+    
+    Returns:
+        AirportEntry for that airport, or None if it is not in the snapshot
+    """
+    _, airports, index_by_code = index or get_position_index()
+    i = index_by_code.get(code)
+    return airports[i] if i is not None else None
+
+
+def _load_airport_choices():
+    """Read the airport choices from Django's cache, filling it on a miss."""
+    return tuple(cache.get_or_set(
+        AIRPORT_CHOICES_CACHE_KEY,
+        lambda: list(Airport.objects.order_by('code').values_list('code', 'name')),
+        AIRPORT_CHOICES_CACHE_TIMEOUT
+    ))
+
+
+def get_airport_choices():
+    """
+    Get (code, name) pairs for all airports ordered by code.
+    
+    Stored in Django's cache with a short timeout so form dropdowns do not
+    query the Airport table on every render. Inside a request the result is
+    also kept for the rest of that request, so several forms share one cache
+    read; outside a request every call reads Django's cache.
+    """
+    if not hasattr(_request_state, 'choices'):
+        return _load_airport_choices()
+    if _request_state.choices is None:
+        _request_state.choices = _load_airport_choices()
+    return _request_state.choices
+
+
+def start_request_snapshot():
+    """Begin a per-request airport choices snapshot for the current request."""
+    _request_state.choices = None
+
+
+def clear_request_snapshot():
+    """Discard the current request's airport choices snapshot."""
+    try:
+        del _request_state.choices
+    except AttributeError:
+        pass
+
+
+def clear_airport_cache():
+    """Invalidate the cached airport list and dropdown choices."""
+    if hasattr(_request_state, 'choices'):
+        _request_state.choices = None
+    cache.delete_many([AIRPORT_POSITIONS_CACHE_KEY, AIRPORT_CHOICES_CACHE_KEY])
@@ -0,0 +1,16 @@
+"""
+URL path converters for the Flight Routes System.
+"""
+
+
+class AirportCodeConverter:
+    """Match a 3-letter uppercase IATA airport code."""
+    regex = '[A-Z]{3}'
+    
+    def to_python(self, value):
+        """Return the code as matched."""
+        return value
+    
+    def to_url(self, value):
+        """Return the code for use in a URL."""
+        return value
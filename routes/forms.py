@@ -3,10 +3,140 @@ Forms for the Flight Routes System.
 
 This module defines forms for adding routes and searching for Nth node.
 """
+import re
+
 from django import forms
+from django.core.exceptions import EmptyResultSet
+from django.forms.models import ModelChoiceIterator
+from .cache import get_airport_choices
 from .models import Airport, Route
 
 
+# IATA codes: exactly three ASCII letters (normalised to uppercase in clean_code)
+_CODE_RE = re.compile(r'[A-Za-z]{3}')
+
+
+def airport_label(code, name):
+    """Return the dropdown label for an airport."""
+    return f"{code} - {name}"
+
+
+class CachedAirportChoiceIterator(ModelChoiceIterator):
+    """
+    Choice iterator that reads airport options from the cache instead of the queryset.
+    
+    The cached choices list every airport, so a field whose queryset is
+    filtered or sliced, or that sets limit_choices_to, iterates its queryset
+    as usual.
+    """
+    
+    def _uses_cache(self):
+        """Return True if the field's queryset covers every airport."""
+        query = self.queryset.query
+        return not (query.where or query.is_sliced or self.field.get_limit_choices_to())
+    
+    def __iter__(self):
+        if not self._uses_cache():
+            yield from super().__iter__()
+            return
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for code, name in get_airport_choices():
+            yield (code, airport_label(code, name))
+    
+    def __len__(self):
+        if not self._uses_cache():
+            return super().__len__()
+        return len(get_airport_choices()) + (self.field.empty_label is not None)
+    
+    def __bool__(self):
+        if not self._uses_cache():
+            return super().__bool__()
+        return self.field.empty_label is not None or bool(get_airport_choices())
+
+
+class AirportChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField for airports.
+    
+    Options are rendered from the cached airport choices; the queryset is
+    only used to resolve the submitted code on validation. Restricting the
+    queryset (filter(), slicing or limit_choices_to) opts the field out of
+    the cache, and its options are queried as usual. A form can share
+    one batch of resolved airports between several fields with
+    set_prefetched_airports() (see AirportFieldsMixin); the batch is
+    ignored once the field's queryset is replaced.
+    """
+    iterator = CachedAirportChoiceIterator
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prefetched_airports = None
+        self._prefetched_queryset = None
+    
+    def set_prefetched_airports(self, airports):
+        """Resolve submitted codes from `airports`, fetched with this field's current queryset."""
+        self.prefetched_airports = airports
+        self._prefetched_queryset = self.queryset
+    
+    def label_from_instance(self, obj):
+        """Return the option label for an airport."""
+        return airport_label(obj.code, obj.name)
+    
+    def to_python(self, value):
+        """Resolve the submitted code, using airports prefetched by the form when available."""
+        if (self.prefetched_airports is None or self.queryset is not self._prefetched_queryset
+                or value in self.empty_values or isinstance(value, self.queryset.model)):
+            return super().to_python(value)
+        try:
+            return self.prefetched_airports[value]
+        except (KeyError, TypeError):
+            raise forms.ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+
+
+class AirportFieldsMixin:
+    """
+    Form mixin sharing airport data between the form's AirportChoiceFields.
+    
+    On a bound form, the codes submitted for every field named in
+    `airport_field_names` are resolved with one in_bulk() query per
+    distinct field queryset (a single query when the fields share the same
+    queryset) instead of one .get() per field. Rendering needs no
+    coordination: the fields all read the per-request airport choices
+    snapshot.
+    """
+    airport_field_names = ()
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize form and resolve submitted airport codes in bulk."""
+        super().__init__(*args, **kwargs)
+        if not self.is_bound:
+            return
+        # Group fields by their queryset's SQL so each field only accepts
+        # airports its own queryset allows
+        groups = {}
+        for name in self.airport_field_names:
+            field = self.fields[name]
+            try:
+                key = str(field.queryset.query)
+            except EmptyResultSet:
+                continue  # queryset.none() matches nothing; leave it to the field
+            fields, codes = groups.setdefault(key, ([], []))
+            fields.append(field)
+            code = self[name].data
+            # Airport instances (e.g. from initial data) need no lookup
+            if code not in forms.Field.empty_values and not isinstance(code, Airport):
+                codes.append(code)
+        for fields, codes in groups.values():
+            airports = fields[0].queryset.in_bulk(codes)
+            for field in fields:
+                field.set_prefetched_airports(airports)
+
+
 class AirportForm(forms.ModelForm):
     """
     Form for adding a new airport.
@@ -40,6 +170,7 @@ class AirportForm(forms.ModelForm):
     position = forms.IntegerField(
         label="Position",
         min_value=1,
+        max_value=32767,  # Upper bound of Airport.position (PositiveSmallIntegerField)
         widget=forms.NumberInput(attrs={
             'class': 'form-control',
             'placeholder': 'Position in route sequence (must be unique)',
@@ -54,30 +185,29 @@ class AirportForm(forms.ModelForm):
     
     def clean_code(self):
         """Validate and normalize airport code."""
-        code = self.cleaned_data.get('code', '').upper().strip()
-        if len(code) != 3:
-            raise forms.ValidationError('Airport code must be exactly 3 characters.')
-        if not code.isalpha():
-            raise forms.ValidationError('Airport code must contain only letters.')
-        return code
-    
-    def clean_position(self):
-        """Validate position uniqueness."""
-        position = self.cleaned_data.get('position')
-        if position is not None:
-            # Check if position is already taken by another airport
-            existing_airport = Airport.objects.filter(position=position).exclude(
-                pk=self.instance.pk if self.instance.pk else None
-            ).first()
-            if existing_airport:
-                raise forms.ValidationError(
-                    f'Position {position} is already taken by airport {existing_airport.code} ({existing_airport.name}). '
-                    f'Please choose a different position.'
-                )
-        return position
-
-
-class AirportRouteForm(forms.ModelForm):
+        code = (self.cleaned_data.get('code') or '').strip()
+        if not _CODE_RE.fullmatch(code):
+            raise forms.ValidationError('Airport code must be exactly 3 letters.')
+        return code.upper()
+    
+    def validate_unique(self):
+        """
+        Run ModelForm uniqueness checks, except for position.
+        
+        Position uniqueness is enforced by its unique index; AddAirportView
+        turns the IntegrityError into a form error. The code check stays:
+        code is the primary key, so saving a duplicate would update the
+        existing airport instead of failing.
+        """
+        exclude = self._get_validation_exclusions()
+        exclude.add('position')
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except forms.ValidationError as e:
+            self._update_errors(e)
+
+
+class AirportRouteForm(AirportFieldsMixin, forms.ModelForm):
     """
     Form for adding a new route between airports.
     
@@ -86,15 +216,15 @@ class AirportRouteForm(forms.ModelForm):
         destination: Destination airport (dropdown)
         distance: Flight distance in kilometers
     """
-    source = forms.ModelChoiceField(
-        queryset=Airport.objects.all().order_by('code'),
+    source = AirportChoiceField(
+        queryset=Airport.objects.only('code', 'name').order_by('code'),
         label="Source Airport",
         empty_label="Select source airport",
         widget=forms.Select(attrs={'class': 'form-control'}),
         help_text="Select the source airport"
     )
-    destination = forms.ModelChoiceField(
-        queryset=Airport.objects.all().order_by('code'),
+    destination = AirportChoiceField(
+        queryset=Airport.objects.only('code', 'name').order_by('code'),
         label="Destination Airport",
         empty_label="Select destination airport",
         widget=forms.Select(attrs={'class': 'form-control'}),
@@ -111,17 +241,12 @@ class AirportRouteForm(forms.ModelForm):
         help_text="Flight distance in kilometers"
     )
     
+    airport_field_names = ('source', 'destination')
+    
     class Meta:
         model = Route
         fields = ['source', 'destination', 'distance']
     
-    def __init__(self, *args, **kwargs):
-        """Initialize form and optimize queryset."""
-        super().__init__(*args, **kwargs)
-        # Optimize queryset if needed (though ModelChoiceField handles this)
-        self.fields['source'].queryset = Airport.objects.all().order_by('code')
-        self.fields['destination'].queryset = Airport.objects.all().order_by('code')
-    
     def clean(self):
         """Validate form data."""
         cleaned_data = super().clean()
@@ -134,21 +259,39 @@ class AirportRouteForm(forms.ModelForm):
                 "Source and destination airports cannot be the same."
             )
         
-        # Check for duplicate routes
-        if source and destination:
-            existing_route = Route.objects.filter(
-                source=source,
-                destination=destination
-            ).exists()
-            if existing_route and not self.instance.pk:
-                raise forms.ValidationError(
-                    f"A route from {source.code} to {destination.code} already exists."
-                )
-        
+        # Duplicate routes are rejected by the (source, destination) unique
+        # index on INSERT; AddRouteView turns the IntegrityError into a form error.
         return cleaned_data
+    
+    def _post_clean(self):
+        """
+        Skip model validation once form validation has failed.
+        
+        A circular route or unknown airport is already reported by the form;
+        Route.full_clean() would only repeat the error after querying for the
+        FK and check constraints.
+        """
+        if self._errors:
+            return
+        super()._post_clean()
+    
+    def _get_validation_exclusions(self):
+        """
+        Exclude the airport FKs from Route.full_clean().
+        
+        The form fields already resolved both airports from the database, so
+        re-validating the FKs would only repeat those lookups.
+        """
+        exclude = super()._get_validation_exclusions()
+        exclude.update({'source', 'destination'})
+        return exclude
+    
+    def validate_unique(self):
+        """Skip the pre-INSERT unique_together SELECT; the database enforces it."""
+        pass
 
 
-class SearchForm(forms.Form):
+class SearchForm(AirportFieldsMixin, forms.Form):
     """
     Form for searching Nth left/right node (Question 1).
     
@@ -157,13 +300,16 @@ class SearchForm(forms.Form):
         direction: Direction to traverse ('left' or 'right')
         n: Number of positions to traverse
     """
+    airport_field_names = ('starting_airport',)
+    
     DIRECTION_CHOICES = [
         ('left', 'Left (lower position numbers)'),
         ('right', 'Right (higher position numbers)'),
     ]
     
-    starting_airport = forms.ModelChoiceField(
-        queryset=Airport.objects.all().order_by('code'),
+    # NthNodeSearchView reads the start position from the cached airport list
+    starting_airport = AirportChoiceField(
+        queryset=Airport.objects.only('code', 'name').order_by('code'),
         label="Starting Airport",
         empty_label="Select starting airport",
         widget=forms.Select(attrs={'class': 'form-control'}),
@@ -185,8 +331,3 @@ class SearchForm(forms.Form):
         }),
         help_text="Number of positions to traverse"
     )
-    
-    def __init__(self, *args, **kwargs):
-        """Initialize form."""
-        super().__init__(*args, **kwargs)
-        self.fields['starting_airport'].queryset = Airport.objects.all().order_by('code')
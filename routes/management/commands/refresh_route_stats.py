@@ -0,0 +1,18 @@
+"""
+Management command to rebuild the cached longest/shortest route statistics.
+
+Run it after writes that bypass the Route signal handlers, such as
+QuerySet.update(), bulk_create() or raw SQL.
+"""
+from django.core.management.base import BaseCommand
+from routes.models import RouteStats
+
+
+class Command(BaseCommand):
+    """Recompute the RouteStats row from the Route table."""
+    help = "Recompute the longest and shortest route statistics from the Route table."
+    
+    def handle(self, *args, **options):
+        """Refresh the statistics and report the new extremes."""
+        stats = RouteStats.refresh()
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {stats}."))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0005_remove_route_routes_rout_duratio_4d4ed3_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='route',
+            index=models.Index(fields=['distance', 'source', 'destination'], name='route_dist_src_dst_idx'),
+        ),
+    ]
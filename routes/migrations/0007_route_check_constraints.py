@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0006_route_dist_src_dst_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='route',
+            constraint=models.CheckConstraint(check=models.Q(('source', models.F('destination')), _negated=True), name='route_src_neq_dst'),
+        ),
+        migrations.AddConstraint(
+            model_name='route',
+            constraint=models.CheckConstraint(check=models.Q(('distance__gt', 0)), name='route_positive_distance'),
+        ),
+    ]
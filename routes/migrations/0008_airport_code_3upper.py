@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0007_route_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='airport',
+            constraint=models.CheckConstraint(check=models.Q(('code__regex', '^[A-Z]{3}$')), name='airport_code_3upper', violation_error_message='Airport code must be exactly 3 uppercase letters.'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0008_airport_code_3upper'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RouteStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('max_distance', models.IntegerField(blank=True, null=True)),
+                ('min_distance', models.IntegerField(blank=True, null=True)),
+                ('max_route', models.ForeignKey(blank=True, help_text='Route with the longest distance', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='routes.route')),
+                ('min_route', models.ForeignKey(blank=True, help_text='Route with the shortest distance', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='routes.route')),
+            ],
+            options={
+                'verbose_name': 'Route statistics',
+                'verbose_name_plural': 'Route statistics',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0009_routestats'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='airport',
+            name='position',
+            field=models.PositiveSmallIntegerField(help_text='Position in the route sequence (used for left/right traversal)', unique=True),
+        ),
+    ]
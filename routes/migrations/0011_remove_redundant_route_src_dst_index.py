@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0010_alter_airport_position_smallint'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='route',
+            name='routes_rout_source__0c7100_idx',
+        ),
+    ]
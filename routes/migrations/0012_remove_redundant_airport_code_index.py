@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:26
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0011_remove_redundant_route_src_dst_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='airport',
+            name='routes_airp_code_0aae2b_idx',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:28
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0012_remove_redundant_airport_code_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='airport',
+            name='routes_airp_positio_9bd3fa_idx',
+        ),
+    ]
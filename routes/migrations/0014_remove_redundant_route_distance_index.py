@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 07:34
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('routes', '0013_remove_redundant_airport_position_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='route',
+            name='routes_rout_distanc_77243c_idx',
+        ),
+    ]
@@ -4,9 +4,9 @@ Models for the Flight Routes System.
 This module defines the Airport and Route models with proper relationships,
 constraints, and optimizations.
 """
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
-from django.db.models import Max, Min, Q
+from django.db.models import F, Q
 
 
 class Airport(models.Model):
@@ -28,16 +28,22 @@ class Airport(models.Model):
         max_length=100,
         help_text="Full name of the airport"
     )
-    position = models.IntegerField(
+    position = models.PositiveSmallIntegerField(
         unique=True,
         help_text="Position in the route sequence (used for left/right traversal)"
     )
     
     class Meta:
         ordering = ['position']  # Default ordering by position
-        indexes = [
-            models.Index(fields=['position']),  # Index for efficient position queries
-            models.Index(fields=['code']),  # Index for code lookups
+        # No explicit indexes: code is the primary key and position is unique,
+        # so both are already indexed
+        constraints = [
+            # Codes are normalised to uppercase in AirportForm.clean_code / save()
+            models.CheckConstraint(
+                check=Q(code__regex=r'^[A-Z]{3}$'),
+                name='airport_code_3upper',
+                violation_error_message='Airport code must be exactly 3 uppercase letters.',
+            ),
         ]
         verbose_name = "Airport"
         verbose_name_plural = "Airports"
@@ -46,29 +52,27 @@ class Airport(models.Model):
         """String representation of the airport."""
         return f"{self.code} - {self.name}"
     
-    def clean(self):
-        """Validate airport data."""
-        super().clean()
-        # Ensure code is uppercase
-        if self.code:
-            self.code = self.code.upper()
-        # Validate code length
-        if self.code and len(self.code) != 3:
-            raise ValidationError({'code': 'Airport code must be exactly 3 characters.'})
-        # Validate position uniqueness
-        if self.position is not None:
-            existing_airport = Airport.objects.filter(position=self.position).exclude(pk=self.pk).first()
-            if existing_airport:
-                raise ValidationError({
-                    'position': f'Position {self.position} is already taken by airport {existing_airport.code} ({existing_airport.name}).'
-                })
-    
     def save(self, *args, **kwargs):
         """Override save to ensure code is uppercase."""
-        self.full_clean()
+        if self.code:
+            self.code = self.code.upper()
         super().save(*args, **kwargs)
 
 
+class RouteManager(models.Manager):
+    """
+    Route manager that joins the source and destination airports.
+    
+    Exposed as Route.with_airports rather than as the default manager, so
+    Route.objects stays a plain manager: only() and defer() on a default
+    select_related() would raise FieldError for deferred foreign keys.
+    """
+    
+    def get_queryset(self):
+        """Return routes with their airports loaded in the same query."""
+        return super().get_queryset().select_related('source', 'destination')
+
+
 class Route(models.Model):
     """
     Route model representing flight routes between airports.
@@ -99,64 +103,62 @@ class Route(models.Model):
         help_text="Timestamp when the route was created"
     )
     
+    objects = models.Manager()  # Declared first so it stays the default manager
+    with_airports = RouteManager()
+    
     class Meta:
         ordering = ['-created_at']  # Order by creation date (newest first)
         indexes = [
-            models.Index(fields=['source', 'destination']),  # Composite index for route lookups
-            models.Index(fields=['distance']),  # Index for distance queries
+            # Covers shortest/longest lookups (ORDER BY distance + distance=X filter);
+            # as a prefix it also serves plain distance lookups
+            models.Index(fields=['distance', 'source', 'destination'], name='route_dist_src_dst_idx'),
         ]
-        # Prevent duplicate routes between the same airports
+        # Prevent duplicate routes between the same airports; the unique index
+        # also serves (source, destination) lookups, so no separate index is needed
         unique_together = [['source', 'destination']]
+        # Enforce route invariants in the database so saves skip full_clean()
+        constraints = [
+            models.CheckConstraint(check=~Q(source=F('destination')), name='route_src_neq_dst'),
+            models.CheckConstraint(check=Q(distance__gt=0), name='route_positive_distance'),
+        ]
         verbose_name = "Route"
         verbose_name_plural = "Routes"
     
     def __str__(self):
         """String representation of the route."""
-        return f"{self.source.code} → {self.destination.code} ({self.distance} km)"
+        # Airport.code is the primary key, so the FK columns already hold the
+        # codes; reading them avoids lazy-loading the related airports.
+        return f"{self.source_id} → {self.destination_id} ({self.distance} km)"
     
     def clean(self):
         """Validate route data."""
         super().clean()
         # Prevent circular routes (airport to itself)
-        if self.source == self.destination:
+        if self.source_id is not None and self.source_id == self.destination_id:
             raise ValidationError(
                 {'destination': 'Source and destination airports cannot be the same.'}
             )
         # Validate distance is positive
-        if self.distance <= 0:
+        if self.distance is not None and self.distance <= 0:
             raise ValidationError({'distance': 'Distance must be a positive integer.'})
     
-    def save(self, *args, **kwargs):
-        """Override save to validate route before saving."""
-        self.full_clean()
-        super().save(*args, **kwargs)
-    
     @classmethod
     def get_longest_distance_airport(cls):
         """
         Get the airport that has the route with the longest distance.
-        Considers both outgoing and incoming routes.
+        The source airport of the longest route is returned; its routes in
+        either direction are considered by the caller.
         
         Returns:
             tuple: (airport, max_distance) or (None, None) if no routes exist
         """
-        # Get the maximum distance from all routes
-        max_distance_result = cls.objects.aggregate(max_distance=Max('distance'))
-        max_distance = max_distance_result.get('max_distance')
+        # Read the precomputed longest route from the RouteStats row
+        route = RouteStats.get_stats().max_route
         
-        if max_distance is None:
+        if route is None:
             return None, None
         
-        # Find airports that have routes with this maximum distance
-        # Check both outgoing and incoming routes
-        airports_with_max_distance = Airport.objects.filter(
-            Q(outgoing_routes__distance=max_distance) | 
-            Q(incoming_routes__distance=max_distance)
-        ).distinct().select_related()
-        
-        # Return the first airport found (or could return all if multiple)
-        airport = airports_with_max_distance.first()
-        return airport, max_distance
+        return route.source, route.distance
     
     @classmethod
     def get_shortest_route(cls):
@@ -166,4 +168,115 @@ class Route(models.Model):
         Returns:
             Route object with shortest distance, or None if no routes exist
         """
-        return cls.objects.select_related('source', 'destination').order_by('distance').first()
+        return RouteStats.get_stats().min_route
+
+
+class RouteStats(models.Model):
+    """
+    Singleton row (pk=1) caching the longest and shortest routes.
+    
+    Kept up to date by the Route post_save/post_delete signal handlers so the
+    longest/shortest lookups are a single primary key read. Writes that fire
+    no signals (QuerySet.update(), bulk_create(), raw SQL) leave the row
+    stale; run ``manage.py refresh_route_stats`` after them.
+    
+    Attributes:
+        max_distance: Distance of the longest route
+        min_distance: Distance of the shortest route
+        max_route: The longest route
+        min_route: The shortest route
+    """
+    SINGLETON_PK = 1
+    
+    max_distance = models.IntegerField(null=True, blank=True)
+    min_distance = models.IntegerField(null=True, blank=True)
+    max_route = models.ForeignKey(
+        Route,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Route with the longest distance"
+    )
+    min_route = models.ForeignKey(
+        Route,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Route with the shortest distance"
+    )
+    
+    class Meta:
+        verbose_name = "Route statistics"
+        verbose_name_plural = "Route statistics"
+    
+    def __str__(self):
+        """String representation of the route statistics."""
+        return f"Route stats (min {self.min_distance} km, max {self.max_distance} km)"
+    
+    @classmethod
+    def get_stats(cls):
+        """
+        Get the statistics row with both routes and their airports loaded.
+        
+        Rebuilds the row if it does not exist yet.
+        """
+        stats = cls.objects.select_related(
+            'max_route__source', 'max_route__destination',
+            'min_route__source', 'min_route__destination',
+        ).filter(pk=cls.SINGLETON_PK).first()
+        if stats is None:
+            stats = cls.refresh()
+        return stats
+    
+    @classmethod
+    def refresh(cls):
+        """
+        Recompute both extremes from the Route table (two indexed LIMIT 1 scans).
+        
+        The statistics row is locked first, so concurrent route_saved() updates
+        wait and then compare against the recomputed values.
+        """
+        with transaction.atomic():
+            cls.objects.select_for_update().filter(pk=cls.SINGLETON_PK).first()
+            routes = Route.with_airports.all()
+            max_route = routes.order_by('-distance').first()
+            min_route = routes.order_by('distance').first()
+            stats, _ = cls.objects.update_or_create(
+                pk=cls.SINGLETON_PK,
+                defaults={
+                    'max_route': max_route,
+                    'max_distance': max_route.distance if max_route else None,
+                    'min_route': min_route,
+                    'min_distance': min_route.distance if min_route else None,
+                }
+            )
+        return stats
+    
+    @classmethod
+    def route_saved(cls, route, created):
+        """Update the statistics after a route is created or changed."""
+        holders = cls.objects.filter(pk=cls.SINGLETON_PK).values_list(
+            'max_route_id', 'min_route_id'
+        ).first()
+        if holders is None or (not created and route.pk in holders):
+            # The current longest/shortest route changed; its replacement is unknown
+            cls.refresh()
+            return
+        # Compare inside the UPDATE so concurrent saves cannot overwrite a
+        # longer maximum or a shorter minimum written in the meantime
+        stats = cls.objects.filter(pk=cls.SINGLETON_PK)
+        stats.filter(
+            Q(max_distance__isnull=True) | Q(max_distance__lt=route.distance)
+        ).update(max_route=route, max_distance=route.distance)
+        stats.filter(
+            Q(min_distance__isnull=True) | Q(min_distance__gt=route.distance)
+        ).update(min_route=route, min_distance=route.distance)
+    
+    @classmethod
+    def route_deleted(cls, route):
+        """Update the statistics after a route is deleted."""
+        stats = cls.objects.filter(pk=cls.SINGLETON_PK).first()
+        if stats is None or route.distance in (stats.max_distance, stats.min_distance):
+            cls.refresh()
@@ -0,0 +1,31 @@
+"""
+Paginators for the Flight Routes System.
+
+Django's default Paginator runs SELECT COUNT(*) on every page load, which
+dominates list-view cost on large tables.
+"""
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from .utils import ESTIMATE_THRESHOLD, estimated_count
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that uses table statistics instead of COUNT(*) for large tables.
+    
+    Unfiltered querysets read the database's row estimate (see
+    routes.utils.estimated_count). The estimate is only used above
+    ESTIMATE_THRESHOLD rows; smaller tables, filtered querysets and
+    backends without statistics fall back to the exact count.
+    """
+    ESTIMATE_THRESHOLD = ESTIMATE_THRESHOLD
+    
+    @cached_property
+    def count(self):
+        """Return the (possibly estimated) total number of objects."""
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            estimate = estimated_count(self.object_list.model, self.object_list.db)
+            if estimate is not None and estimate > self.ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
@@ -0,0 +1,70 @@
+"""
+Signal handlers for the Flight Routes System.
+
+Keeps cached data in sync with Airport and Route writes.
+"""
+from django.core.cache import cache
+from django.core.signals import request_finished, request_started
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .cache import clear_airport_cache, clear_request_snapshot, start_request_snapshot
+from .models import Airport, Route, RouteStats
+
+# Cache keys for the home page counts
+AIRPORT_COUNT_CACHE_KEY = 'airport_count'
+ROUTE_COUNT_CACHE_KEY = 'route_count'
+COUNT_CACHE_TIMEOUT = 300  # seconds
+
+
+@receiver(post_save, sender=Airport)
+@receiver(post_delete, sender=Airport)
+@receiver(post_save, sender=Route)
+@receiver(post_delete, sender=Route)
+def invalidate_counts(sender, using, **kwargs):
+    """
+    Drop the cached airport/route counts once a write to either table commits.
+    
+    Clearing before COMMIT would let a concurrent request refill the cache
+    with the old counts.
+    """
+    transaction.on_commit(
+        lambda: cache.delete_many([AIRPORT_COUNT_CACHE_KEY, ROUTE_COUNT_CACHE_KEY]),
+        using=using
+    )
+
+
+@receiver(post_save, sender=Airport)
+@receiver(post_delete, sender=Airport)
+def invalidate_airport_cache(sender, using, **kwargs):
+    """
+    Drop the cached airport list and dropdown choices once the write commits.
+    
+    Clearing before COMMIT would let a concurrent request refill the cache
+    with the old rows.
+    """
+    transaction.on_commit(clear_airport_cache, using=using)
+
+
+@receiver(request_started)
+def start_airport_choices_snapshot(sender, **kwargs):
+    """Start each request with a fresh read of the cached airport choices."""
+    start_request_snapshot()
+
+
+@receiver(request_finished)
+def end_airport_choices_snapshot(sender, **kwargs):
+    """Drop the request's airport choices so later reads are not served stale."""
+    clear_request_snapshot()
+
+
+@receiver(post_save, sender=Route)
+def update_route_stats_on_save(sender, instance, created, **kwargs):
+    """Keep the longest/shortest route statistics in sync with saves."""
+    RouteStats.route_saved(instance, created)
+
+
+@receiver(post_delete, sender=Route)
+def update_route_stats_on_delete(sender, instance, **kwargs):
+    """Keep the longest/shortest route statistics in sync with deletes."""
+    RouteStats.route_deleted(instance)
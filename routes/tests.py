@@ -7,11 +7,23 @@ Tests cover:
 - View functionality
 - Query optimizations
 """
+from unittest.mock import patch
+from io import StringIO
+from django.core.management import call_command
+from django.core.signals import request_finished, request_started
+from django.contrib import admin
 from django.test import TestCase
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from .models import Airport, Route
-from .forms import AirportRouteForm, SearchForm
+from django.urls import reverse
+from .models import Airport, Route, RouteStats
+from .cache import AIRPORT_CHOICES_CACHE_KEY, find_airport_at_position
+from .forms import AirportChoiceField, AirportForm, AirportRouteForm, SearchForm
+from .admin import RouteAdmin
+from .paginators import FasterAdminPaginator
+from .signals import AIRPORT_COUNT_CACHE_KEY
+from .utils import fast_count
 
 
 class AirportModelTest(TestCase):
@@ -19,16 +31,18 @@ class AirportModelTest(TestCase):
     
     def setUp(self):
         """Set up test data."""
-        self.airport1 = Airport.objects.create(
-            code='JFK',
-            name='John F. Kennedy International Airport',
-            position=1
-        )
-        self.airport2 = Airport.objects.create(
-            code='LAX',
-            name='Los Angeles International Airport',
-            position=2
-        )
+        self.airport1, self.airport2 = Airport.objects.bulk_create([
+            Airport(
+                code='JFK',
+                name='John F. Kennedy International Airport',
+                position=1
+            ),
+            Airport(
+                code='LAX',
+                name='Los Angeles International Airport',
+                position=2
+            ),
+        ])
     
     def test_airport_creation(self):
         """Test creating an airport."""
@@ -51,6 +65,20 @@ class AirportModelTest(TestCase):
                 position=5
             )
     
+    def test_airport_position_unique(self):
+        """Test that airport positions must be unique."""
+        with self.assertRaises(IntegrityError):
+            Airport.objects.create(
+                code='ORD',
+                name='Chicago O\'Hare',
+                position=1
+            )
+    
+    def test_airport_code_db_constraint(self):
+        """Test that the database rejects codes that are not 3 letters."""
+        with self.assertRaises(IntegrityError):
+            Airport.objects.create(code='AB1', name='Invalid Airport', position=4)
+    
     def test_airport_str(self):
         """Test airport string representation."""
         self.assertEqual(str(self.airport1), 'JFK - John F. Kennedy International Airport')
@@ -61,16 +89,18 @@ class RouteModelTest(TestCase):
     
     def setUp(self):
         """Set up test data."""
-        self.airport1 = Airport.objects.create(
-            code='JFK',
-            name='John F. Kennedy International Airport',
-            position=1
-        )
-        self.airport2 = Airport.objects.create(
-            code='LAX',
-            name='Los Angeles International Airport',
-            position=2
-        )
+        self.airport1, self.airport2 = Airport.objects.bulk_create([
+            Airport(
+                code='JFK',
+                name='John F. Kennedy International Airport',
+                position=1
+            ),
+            Airport(
+                code='LAX',
+                name='Los Angeles International Airport',
+                position=2
+            ),
+        ])
         self.route = Route.objects.create(
             source=self.airport1,
             destination=self.airport2,
@@ -83,6 +113,17 @@ class RouteModelTest(TestCase):
         self.assertEqual(self.route.destination, self.airport2)
         self.assertEqual(self.route.distance, 360)
     
+    def test_with_airports_manager_joins_airports(self):
+        """Test that routes load their airports without extra queries."""
+        with self.assertNumQueries(1):
+            route = Route.with_airports.get(pk=self.route.pk)
+            self.assertEqual(route.source.name, 'John F. Kennedy International Airport')
+            self.assertEqual(route.destination.name, 'Los Angeles International Airport')
+    
+    def test_default_manager_allows_only(self):
+        """Test that the default manager can defer the airport foreign keys."""
+        self.assertEqual([route.distance for route in Route.objects.only('distance')], [360])
+    
     def test_circular_route_prevention(self):
         """Test that circular routes (same source and destination) are prevented."""
         route = Route(source=self.airport1, destination=self.airport1, distance=100)
@@ -98,6 +139,11 @@ class RouteModelTest(TestCase):
                 distance=400
             )
     
+    def test_circular_route_db_constraint(self):
+        """Test that the database rejects circular routes saved directly."""
+        with self.assertRaises(IntegrityError):
+            Route.objects.create(source=self.airport1, destination=self.airport1, distance=100)
+    
     def test_negative_distance_prevention(self):
         """Test that negative distance is prevented."""
         route = Route(source=self.airport1, destination=self.airport2, distance=-10)
@@ -124,6 +170,48 @@ class RouteModelTest(TestCase):
         
         shortest = Route.get_shortest_route()
         self.assertEqual(shortest.distance, 180)
+    
+    def test_route_stats_updated_on_delete(self):
+        """Test that longest/shortest lookups follow route deletions."""
+        airport3 = Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        longest = Route.objects.create(source=self.airport2, destination=airport3, distance=500)
+        shortest = Route.objects.create(source=airport3, destination=self.airport1, distance=180)
+        longest.delete()
+        shortest.delete()
+        
+        airport, max_distance = Route.get_longest_distance_airport()
+        self.assertEqual((airport, max_distance), (self.airport1, 360))
+        self.assertEqual(Route.get_shortest_route(), self.route)
+    
+    def test_route_stats_updated_on_distance_change(self):
+        """Test that editing the longest route's distance is reflected."""
+        airport3 = Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        route = Route.objects.create(source=self.airport2, destination=airport3, distance=500)
+        route.distance = 100
+        route.save()
+        
+        self.assertEqual(Route.get_longest_distance_airport()[1], 360)
+        self.assertEqual(Route.get_shortest_route(), route)
+    
+    def test_route_stats_keeps_longer_concurrent_maximum(self):
+        """Test that a save does not overwrite a longer maximum written meanwhile."""
+        RouteStats.objects.filter(pk=RouteStats.SINGLETON_PK).update(max_distance=1000)
+        airport3 = Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        Route.objects.create(source=self.airport2, destination=airport3, distance=900)
+        stats = RouteStats.objects.get(pk=RouteStats.SINGLETON_PK)
+        self.assertEqual((stats.max_route, stats.max_distance), (self.route, 1000))
+    
+    def test_refresh_route_stats_command(self):
+        """Test that the command picks up writes made without signals."""
+        Route.objects.filter(pk=self.route.pk).update(distance=50)
+        call_command('refresh_route_stats', stdout=StringIO())
+        self.assertEqual(Route.get_shortest_route().distance, 50)
+    
+    def test_route_stats_empty(self):
+        """Test longest/shortest lookups when no routes exist."""
+        Route.objects.all().delete()
+        self.assertEqual(Route.get_longest_distance_airport(), (None, None))
+        self.assertIsNone(Route.get_shortest_route())
 
 
 class AirportRouteFormTest(TestCase):
@@ -131,16 +219,18 @@ class AirportRouteFormTest(TestCase):
     
     def setUp(self):
         """Set up test data."""
-        self.airport1 = Airport.objects.create(
-            code='JFK',
-            name='John F. Kennedy International Airport',
-            position=1
-        )
-        self.airport2 = Airport.objects.create(
-            code='LAX',
-            name='Los Angeles International Airport',
-            position=2
-        )
+        self.airport1, self.airport2 = Airport.objects.bulk_create([
+            Airport(
+                code='JFK',
+                name='John F. Kennedy International Airport',
+                position=1
+            ),
+            Airport(
+                code='LAX',
+                name='Los Angeles International Airport',
+                position=2
+            ),
+        ])
     
     def test_valid_form(self):
         """Test form with valid data."""
@@ -152,6 +242,67 @@ class AirportRouteFormTest(TestCase):
         form = AirportRouteForm(data=form_data)
         self.assertTrue(form.is_valid())
     
+    def test_airport_dropdowns_load_only_label_columns(self):
+        """Test that the airport dropdowns only select the columns used in labels."""
+        form = AirportRouteForm()
+        for field_name in ('source', 'destination'):
+            field = form.fields[field_name]
+            self.assertEqual(field.queryset.query.deferred_loading, ({'code', 'name'}, False))
+            self.assertEqual(field.label_from_instance(self.airport1), str(self.airport1))
+    
+    def test_airports_resolved_in_one_query(self):
+        """Test that source and destination are resolved with a single query."""
+        form_data = {
+            'source': self.airport1.pk,
+            'destination': self.airport2.pk,
+            'distance': 360
+        }
+        with self.assertNumQueries(1):
+            form = AirportRouteForm(data=form_data)
+        self.assertEqual(form.fields['source'].prefetched_airports.keys(), {'JFK', 'LAX'})
+        # Only the distance check constraint is validated against the database
+        with self.assertNumQueries(1):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['destination'], self.airport2)
+    
+    def test_restricted_airport_field_rejects_other_codes(self):
+        """Test that a field with a narrowed queryset rejects airports outside it."""
+        airport3 = Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        form = AirportRouteForm(data={
+            'source': self.airport1.pk,
+            'destination': airport3.pk,
+            'distance': 740
+        })
+        form.fields['destination'].queryset = Airport.objects.filter(code='LAX')
+        self.assertFalse(form.is_valid())
+        self.assertIn('destination', form.errors)
+    
+    def test_airport_fields_with_different_querysets(self):
+        """Test that fields declared with different querysets each use their own."""
+        class LaxOnlyRouteForm(AirportRouteForm):
+            destination = AirportChoiceField(queryset=Airport.objects.filter(code='LAX'))
+        
+        airport3 = Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        with self.assertNumQueries(2):
+            form = LaxOnlyRouteForm(data={
+                'source': airport3.pk,
+                'destination': airport3.pk,
+                'distance': 740
+            })
+        self.assertFalse(form.is_valid())
+        self.assertEqual(list(form.errors), ['destination'])
+    
+    def test_unknown_airport_code(self):
+        """Test form validation rejects an airport code that does not exist."""
+        form_data = {
+            'source': 'XXX',
+            'destination': self.airport2.pk,
+            'distance': 360
+        }
+        form = AirportRouteForm(data=form_data)
+        self.assertFalse(form.is_valid())
+        self.assertIn('source', form.errors)
+    
     def test_circular_route_validation(self):
         """Test form validation prevents circular routes."""
         form_data = {
@@ -160,11 +311,14 @@ class AirportRouteFormTest(TestCase):
             'distance': 360
         }
         form = AirportRouteForm(data=form_data)
-        self.assertFalse(form.is_valid())
+        # Airports are resolved when the form is built; model validation is skipped
+        with self.assertNumQueries(0):
+            self.assertFalse(form.is_valid())
         self.assertIn('Source and destination airports cannot be the same', str(form.errors))
+        self.assertNotIn('destination', form.errors)
     
     def test_duplicate_route_validation(self):
-        """Test form validation prevents duplicate routes."""
+        """Test that adding a duplicate route reports an error and saves nothing."""
         Route.objects.create(
             source=self.airport1,
             destination=self.airport2,
@@ -175,8 +329,9 @@ class AirportRouteFormTest(TestCase):
             'destination': self.airport2.pk,
             'distance': 400
         }
-        form = AirportRouteForm(data=form_data)
-        self.assertFalse(form.is_valid())
+        response = self.client.post(reverse('routes:add_route'), form_data)
+        self.assertContains(response, 'A route from JFK to LAX already exists.')
+        self.assertEqual(Route.objects.count(), 1)
 
 
 class SearchFormTest(TestCase):
@@ -200,6 +355,30 @@ class SearchFormTest(TestCase):
         form = SearchForm(data=form_data)
         self.assertTrue(form.is_valid())
     
+    def test_starting_airport_prefetched(self):
+        """Test that the starting airport is resolved in one query."""
+        form_data = {
+            'starting_airport': self.airport1.pk,
+            'direction': 'right',
+            'n': 2
+        }
+        with self.assertNumQueries(1):
+            form = SearchForm(data=form_data)
+        with self.assertNumQueries(0):
+            self.assertTrue(form.is_valid())
+            self.assertEqual(form.cleaned_data['starting_airport'].name, 'John F. Kennedy International Airport')
+    
+    def test_starting_airport_instance(self):
+        """Test that an Airport instance is accepted as the submitted value."""
+        form_data = {
+            'starting_airport': self.airport1,
+            'direction': 'right',
+            'n': 2
+        }
+        form = SearchForm(data=form_data)
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['starting_airport'], self.airport1)
+    
     def test_invalid_n_value(self):
         """Test form validation for negative N value."""
         form_data = {
@@ -209,3 +388,406 @@ class SearchFormTest(TestCase):
         }
         form = SearchForm(data=form_data)
         self.assertFalse(form.is_valid())
+
+
+class DeleteAirportViewTest(TestCase):
+    """Test cases for the delete_airport view."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.airport1, self.airport2 = Airport.objects.bulk_create([
+            Airport(
+                code='JFK',
+                name='John F. Kennedy International Airport',
+                position=1
+            ),
+            Airport(
+                code='LAX',
+                name='Los Angeles International Airport',
+                position=2
+            ),
+        ])
+        Route.objects.create(
+            source=self.airport1,
+            destination=self.airport2,
+            distance=360
+        )
+    
+    def test_delete_blocked_with_routes(self):
+        """Test that airports with routes are not deleted."""
+        self.client.post(reverse('routes:delete_airport', args=['LAX']))
+        self.assertTrue(Airport.objects.filter(code='LAX').exists())
+    
+    def test_delete_blocked_message_counts_routes(self):
+        """Test that the error message reports routes in both directions."""
+        airport3 = Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        Route.objects.create(source=self.airport2, destination=airport3, distance=2800)
+        Route.objects.create(source=airport3, destination=self.airport1, distance=1190)
+        response = self.client.post(reverse('routes:delete_airport', args=['ORD']), follow=True)
+        self.assertContains(response, 'it has 2 associated route(s)')
+    
+    def test_delete_blocked_message_counts_each_route_once(self):
+        """Test that routes in both directions are counted without multiplying."""
+        airport3 = Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        Route.objects.create(source=self.airport2, destination=airport3, distance=2800)
+        Route.objects.create(source=self.airport2, destination=self.airport1, distance=360)
+        response = self.client.post(reverse('routes:delete_airport', args=['LAX']), follow=True)
+        self.assertContains(response, 'it has 3 associated route(s)')
+    
+    def test_delete_url_rejects_malformed_code(self):
+        """Test that the delete URL only matches 3-letter uppercase codes."""
+        response = self.client.post('/airports/JFK1/delete/')
+        self.assertEqual(response.status_code, 404)
+        self.assertTrue(Airport.objects.filter(code='JFK').exists())
+    
+    def test_delete_without_routes(self):
+        """Test deleting an airport with no routes."""
+        Airport.objects.create(code='ORD', name='Chicago O\'Hare', position=3)
+        self.client.post(reverse('routes:delete_airport', args=['ORD']))
+        self.assertFalse(Airport.objects.filter(code='ORD').exists())
+
+
+class HomeViewTest(TestCase):
+    """Test cases for HomeView."""
+    
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.airport1 = Airport.objects.create(
+            code='JFK',
+            name='John F. Kennedy International Airport',
+            position=1
+        )
+    
+    def test_counts_invalidated_on_save(self):
+        """Test that cached counts are refreshed after a new airport is saved."""
+        response = self.client.get(reverse('routes:home'))
+        self.assertEqual(response.context['airport_count'], 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            Airport.objects.create(code='LAX', name='Los Angeles International Airport', position=2)
+        response = self.client.get(reverse('routes:home'))
+        self.assertEqual(response.context['airport_count'], 2)
+    
+    def test_counts_kept_until_commit(self):
+        """Test that cached counts are only dropped once the write commits."""
+        self.client.get(reverse('routes:home'))
+        with self.captureOnCommitCallbacks() as callbacks:
+            Airport.objects.create(code='LAX', name='Los Angeles International Airport', position=2)
+            self.assertEqual(cache.get(AIRPORT_COUNT_CACHE_KEY), 1)
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(AIRPORT_COUNT_CACHE_KEY))
+
+
+class FasterAdminPaginatorTest(TestCase):
+    """Test cases for FasterAdminPaginator."""
+    
+    def setUp(self):
+        """Set up test data."""
+        Airport.objects.bulk_create([
+            Airport(code='JFK', name='John F. Kennedy International Airport', position=1),
+            Airport(code='LAX', name='Los Angeles International Airport', position=2),
+        ])
+    
+    def test_small_table_uses_exact_count(self):
+        """Test that small tables fall back to the exact count."""
+        paginator = FasterAdminPaginator(Airport.objects.all(), 20)
+        self.assertEqual(paginator.count, 2)
+    
+    def test_filtered_queryset_uses_exact_count(self):
+        """Test that filtered querysets are counted exactly."""
+        paginator = FasterAdminPaginator(Airport.objects.filter(position=1), 20)
+        self.assertEqual(paginator.count, 1)
+
+
+class NthNodeSearchViewTest(TestCase):
+    """Test cases for NthNodeSearchView."""
+    
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.airport1, self.airport2 = Airport.objects.bulk_create([
+            Airport(
+                code='JFK',
+                name='John F. Kennedy International Airport',
+                position=1
+            ),
+            Airport(
+                code='LAX',
+                name='Los Angeles International Airport',
+                position=2
+            ),
+        ])
+    
+    def test_right_search(self):
+        """Test finding the airport N positions to the right."""
+        response = self.client.post(reverse('routes:nth_node'), {
+            'starting_airport': self.airport1.pk,
+            'direction': 'right',
+            'n': 1
+        })
+        self.assertEqual(response.context['result']['target_airport'].code, 'LAX')
+    
+    def test_out_of_bounds_search(self):
+        """Test that out-of-bounds searches report an error."""
+        response = self.client.post(reverse('routes:nth_node'), {
+            'starting_airport': self.airport1.pk,
+            'direction': 'left',
+            'n': 1
+        })
+        self.assertIsNone(response.context['result'])
+        self.assertIn('out of bounds', response.context['error_message'])
+    
+    def test_search_from_airport_missing_from_cache(self):
+        """Test that a start airport added without signals rebuilds the cached list."""
+        find_airport_at_position(1)
+        airport3, = Airport.objects.bulk_create([
+            Airport(code='ORD', name='Chicago O\'Hare', position=3),
+        ])
+        response = self.client.post(reverse('routes:nth_node'), {
+            'starting_airport': airport3.pk,
+            'direction': 'left',
+            'n': 2
+        })
+        self.assertEqual(response.context['result']['target_airport'].code, 'JFK')
+
+
+class LongestDurationViewTest(TestCase):
+    """Test cases for LongestDurationView."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.airport1, self.airport2 = Airport.objects.bulk_create([
+            Airport(
+                code='JFK',
+                name='John F. Kennedy International Airport',
+                position=1
+            ),
+            Airport(
+                code='LAX',
+                name='Los Angeles International Airport',
+                position=2
+            ),
+        ])
+        Route.objects.create(source=self.airport1, destination=self.airport2, distance=3980)
+    
+    def test_longest_route_rendered(self):
+        """Test that the longest route is rendered."""
+        response = self.client.get(reverse('routes:longest_duration'))
+        self.assertEqual(response.context['max_distance'], 3980)
+        self.assertContains(response, '<strong>LAX</strong>', html=False)
+        self.assertContains(response, 'Los Angeles International Airport')
+
+
+class AirportCacheTest(TestCase):
+    """Test cases for the cached airport position list."""
+    
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        Airport.objects.bulk_create([
+            Airport(code='JFK', name='John F. Kennedy International Airport', position=1),
+            Airport(code='ORD', name='Chicago O\'Hare', position=5),
+        ])
+    
+    def test_find_airport_at_position(self):
+        """Test binary search lookups for present and missing positions."""
+        self.assertEqual(find_airport_at_position(5).code, 'ORD')
+        self.assertIsNone(find_airport_at_position(3))
+    
+    def test_cache_invalidated_on_save(self):
+        """Test that a new airport is visible after it is saved."""
+        self.assertIsNone(find_airport_at_position(3))
+        with self.captureOnCommitCallbacks(execute=True):
+            Airport.objects.create(code='LAX', name='Los Angeles International Airport', position=3)
+        self.assertEqual(find_airport_at_position(3).code, 'LAX')
+    
+    def test_cache_kept_until_commit(self):
+        """Test that the cache is only cleared once the airport write commits."""
+        find_airport_at_position(5)
+        with self.captureOnCommitCallbacks() as callbacks:
+            Airport.objects.create(code='LAX', name='Los Angeles International Airport', position=3)
+            self.assertIsNone(find_airport_at_position(3))
+        for callback in callbacks:
+            callback()
+        self.assertEqual(find_airport_at_position(3).code, 'LAX')
+
+
+class RouteListViewTest(TestCase):
+    """Test cases for RouteListView."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.airport1, self.airport2 = Airport.objects.bulk_create([
+            Airport(
+                code='JFK',
+                name='John F. Kennedy International Airport',
+                position=1
+            ),
+            Airport(
+                code='LAX',
+                name='Los Angeles International Airport',
+                position=2
+            ),
+        ])
+        Route.objects.create(source=self.airport1, destination=self.airport2, distance=3980)
+    
+    def test_route_list_single_query(self):
+        """Test that the route list page renders routes without per-row queries."""
+        with self.assertNumQueries(2):  # COUNT for pagination + page of routes
+            response = self.client.get(reverse('routes:route_list'))
+        self.assertContains(response, 'Los Angeles International Airport')
+
+
+class FastCountTest(TestCase):
+    """Test cases for fast_count."""
+    
+    def test_falls_back_to_exact_count(self):
+        """Test that backends without statistics return the exact count."""
+        Airport.objects.create(code='JFK', name='John F. Kennedy International Airport', position=1)
+        self.assertEqual(fast_count(Airport), 1)
+        self.assertEqual(fast_count(Route), 0)
+
+
+class AirportFormTest(TestCase):
+    """Test cases for AirportForm."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.airport1 = Airport.objects.create(
+            code='JFK',
+            name='John F. Kennedy International Airport',
+            position=1
+        )
+    
+    def test_taken_position(self):
+        """Test that adding an airport at a taken position reports the holder."""
+        response = self.client.post(reverse('routes:add_airport'), {
+            'code': 'lax',
+            'name': 'Los Angeles International Airport',
+            'position': 1
+        })
+        self.assertContains(response, 'Position 1 is already taken by airport JFK')
+        self.assertFalse(Airport.objects.filter(code='LAX').exists())
+    
+    def test_duplicate_code(self):
+        """Test form validation rejects an existing airport code."""
+        form = AirportForm(data={'code': 'jfk', 'name': 'Duplicate Airport', 'position': 2})
+        self.assertFalse(form.is_valid())
+        self.assertIn('code', form.errors)
+    
+    def test_non_letter_code(self):
+        """Test form validation rejects codes containing non-letters."""
+        form = AirportForm(data={'code': 'L4X', 'name': 'Los Angeles International Airport', 'position': 2})
+        self.assertFalse(form.is_valid())
+        self.assertIn('exactly 3 letters', str(form.errors['code']))
+    
+    def test_valid_form_normalizes_code(self):
+        """Test that a valid form uppercases the airport code."""
+        form = AirportForm(data={'code': 'lax', 'name': 'Los Angeles International Airport', 'position': 2})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['code'], 'LAX')
+
+
+class AirportChoicesCacheTest(TestCase):
+    """Test cases for the cached airport dropdown choices."""
+    
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        self.airport1 = Airport.objects.create(
+            code='JFK',
+            name='John F. Kennedy International Airport',
+            position=1
+        )
+    
+    def test_warm_cache_renders_without_queries(self):
+        """Test that dropdown options are served from the cache once warm."""
+        list(AirportRouteForm().fields['source'].choices)
+        with self.assertNumQueries(0):
+            choices = list(AirportRouteForm().fields['source'].choices)
+        self.assertEqual(choices[1], ('JFK', 'JFK - John F. Kennedy International Airport'))
+    
+    def test_forms_share_request_snapshot(self):
+        """Test that several forms in one request share a single choices read."""
+        request_started.send(sender=self.__class__)
+        try:
+            list(AirportRouteForm().fields['source'].choices)
+            with patch('routes.cache.cache.get_or_set') as get_or_set:
+                list(SearchForm().fields['starting_airport'].choices)
+                list(AirportRouteForm().fields['destination'].choices)
+        finally:
+            request_finished.send(sender=self.__class__)
+        get_or_set.assert_not_called()
+    
+    def test_no_snapshot_outside_request(self):
+        """Test that choices read outside a request are not memoized."""
+        list(SearchForm().fields['starting_airport'].choices)
+        cache.set(AIRPORT_CHOICES_CACHE_KEY, [('LAX', 'Los Angeles International Airport')])
+        codes = [value for value, label in SearchForm().fields['starting_airport'].choices]
+        self.assertEqual(codes, ['', 'LAX'])
+    
+    def test_restricted_queryset_bypasses_cache(self):
+        """Test that a filtered queryset renders only its own airports."""
+        Airport.objects.create(code='LAX', name='Los Angeles International Airport', position=2)
+        list(SearchForm().fields['starting_airport'].choices)
+        field = AirportChoiceField(queryset=Airport.objects.filter(code='LAX'))
+        self.assertEqual([str(value) for value, label in field.choices], ['', 'LAX'])
+    
+    def test_choices_invalidated_on_save(self):
+        """Test that a new airport appears in the dropdown after it is saved."""
+        list(SearchForm().fields['starting_airport'].choices)
+        with self.captureOnCommitCallbacks(execute=True):
+            Airport.objects.create(code='LAX', name='Los Angeles International Airport', position=2)
+        codes = [value for value, label in SearchForm().fields['starting_airport'].choices]
+        self.assertEqual(codes, ['', 'JFK', 'LAX'])
+
+
+class AddRouteViewTest(TestCase):
+    """Test cases for AddRouteView."""
+    
+    def setUp(self):
+        """Set up test data."""
+        cache.clear()
+        Airport.objects.bulk_create([
+            Airport(code=code, name=f'{code} Airport', position=position)
+            for position, code in enumerate(['JFK', 'LAX', 'ORD', 'ATL', 'DFW'], start=1)
+        ])
+    
+    def test_dropdowns_single_query(self):
+        """Test that both dropdowns render from one airport query, without N+1."""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('routes:add_route'))
+        self.assertContains(response, '<option value="DFW">DFW - DFW Airport</option>', count=2)
+    
+    def test_other_integrity_error_not_reported_as_duplicate(self):
+        """Test that a non-duplicate database rejection gets a generic error."""
+        with patch('routes.forms.AirportRouteForm.save', side_effect=IntegrityError):
+            response = self.client.post(reverse('routes:add_route'), {
+                'source': 'JFK', 'destination': 'LAX', 'distance': 360
+            })
+        self.assertNotContains(response, 'already exists')
+        self.assertContains(response, 'This route conflicts with the current airports or routes.')
+
+
+class RouteAdminTest(TestCase):
+    """Test cases for RouteAdmin."""
+    
+    def setUp(self):
+        """Set up test data."""
+        jfk, lax, ord_ = Airport.objects.bulk_create([
+            Airport(code='JFK', name='John F. Kennedy International Airport', position=1),
+            Airport(code='LAX', name='Los Angeles International Airport', position=2),
+            Airport(code='ORD', name='Chicago O\'Hare', position=3),
+        ])
+        self.outgoing = Route.objects.create(source=jfk, destination=lax, distance=360)
+        self.incoming = Route.objects.create(source=ord_, destination=jfk, distance=1190)
+        Route.objects.create(source=lax, destination=ord_, distance=2800)
+    
+    def test_search_matches_code_exactly(self):
+        """Test that searching a lowercase code finds routes in both directions."""
+        model_admin = RouteAdmin(Route, admin.site)
+        queryset, may_have_duplicates = model_admin.get_search_results(None, Route.objects.all(), ' jfk ')
+        self.assertEqual(set(queryset), {self.outgoing, self.incoming})
+        self.assertFalse(may_have_duplicates)
+        self.assertNotIn('LIKE', str(queryset.query))
@@ -0,0 +1,47 @@
+"""
+Utility helpers for the Flight Routes System.
+"""
+from django.db import connections
+
+# Below this many rows an exact COUNT(*) is cheap and estimates are unreliable
+ESTIMATE_THRESHOLD = 10000
+
+
+def estimated_count(model, using='default'):
+    """
+    Read the database's row-count estimate for a model's table.
+    
+    Uses pg_class.reltuples on PostgreSQL and SHOW TABLE STATUS on MySQL;
+    both are O(1) statistics lookups.
+    
+    Returns:
+        int: Estimated row count, or None if the backend has no estimate
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table])
+            row = cursor.fetchone()
+            return row[0] if row else None
+        if connection.vendor == 'mysql':
+            cursor.execute("SHOW TABLE STATUS LIKE %s", [table])
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            columns = [column[0] for column in cursor.description]
+            return row[columns.index('Rows')]
+    return None
+
+
+def fast_count(model, using='default'):
+    """
+    Count a model's rows, using table statistics for large tables.
+    
+    Falls back to an exact count on backends without statistics and when
+    the estimate is at or below ESTIMATE_THRESHOLD rows.
+    """
+    estimate = estimated_count(model, using)
+    if estimate is not None and estimate > ESTIMATE_THRESHOLD:
+        return estimate
+    return model._default_manager.using(using).count()
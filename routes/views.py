@@ -10,13 +10,19 @@ This module contains all views for handling user requests including:
 """
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.core.cache import cache
 from django.views.generic import TemplateView, ListView
-from django.db.models import Q
-from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.db import IntegrityError, transaction
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from .models import Airport, Route
+from .cache import find_airport_at_position, find_airport_by_code, get_position_index
 from .forms import AirportRouteForm, SearchForm, AirportForm
+from .paginators import FasterAdminPaginator
+from .signals import AIRPORT_COUNT_CACHE_KEY, ROUTE_COUNT_CACHE_KEY, COUNT_CACHE_TIMEOUT
+from .utils import fast_count
 
 
 class HomeView(TemplateView):
@@ -26,8 +32,14 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         """Add context data for home page."""
         context = super().get_context_data(**kwargs)
-        context['airport_count'] = Airport.objects.count()
-        context['route_count'] = Route.objects.count()
+        # Counts are cached and invalidated on Airport/Route save/delete;
+        # large tables use the database's row estimate instead of COUNT(*)
+        context['airport_count'] = cache.get_or_set(
+            AIRPORT_COUNT_CACHE_KEY, lambda: fast_count(Airport), COUNT_CACHE_TIMEOUT
+        )
+        context['route_count'] = cache.get_or_set(
+            ROUTE_COUNT_CACHE_KEY, lambda: fast_count(Route), COUNT_CACHE_TIMEOUT
+        )
         return context
 
 
@@ -55,6 +67,18 @@ class AddRouteView(TemplateView):
                     f"({route.distance} km) added successfully!"
                 )
                 return redirect('routes:add_route')
+            except IntegrityError:
+                # Rejected by the database; report a duplicate only if that is the cause
+                source = form.cleaned_data['source']
+                destination = form.cleaned_data['destination']
+                if Route.objects.filter(source=source, destination=destination).exists():
+                    form.add_error(
+                        None,
+                        f"A route from {source.code} to {destination.code} already exists."
+                    )
+                else:
+                    form.add_error(None, "This route conflicts with the current airports or routes.")
+                messages.error(request, "Please correct the errors below.")
             except Exception as e:
                 messages.error(request, f"Error adding route: {str(e)}")
         else:
@@ -93,8 +117,15 @@ class NthNodeSearchView(TemplateView):
             n = form.cleaned_data['n']
             
             try:
-                # Get the starting position
-                start_position = starting_airport.position
+                # Read the start and target from one snapshot of the cached
+                # position-ordered airport list so they agree with each other
+                index = get_position_index(starting_airport.code)
+                start_entry = find_airport_by_code(starting_airport.code, index)
+                if start_entry is None:
+                    raise Airport.DoesNotExist(
+                        f"Airport {starting_airport.code} no longer exists."
+                    )
+                start_position = start_entry.position
                 
                 # Calculate target position based on direction
                 if direction == 'left':
@@ -102,9 +133,8 @@ class NthNodeSearchView(TemplateView):
                 else:  # direction == 'right'
                     target_position = start_position + n
                 
-                # Find airport at target position
-                # Use efficient query with index
-                target_airport = Airport.objects.filter(position=target_position).first()
+                # Binary search for the airport at the target position
+                target_airport = find_airport_at_position(target_position, index)
                 
                 if target_airport:
                     result = {
@@ -152,11 +182,15 @@ class LongestDurationView(TemplateView):
         
         # Get all routes with this maximum distance for display
         if max_distance:
-            # Optimize query with select_related
+            # Display-only rows: fetch dicts to skip model instantiation
             routes = Route.objects.filter(
                 Q(source=airport) | Q(destination=airport),
                 distance=max_distance
-            ).select_related('source', 'destination')
+            ).values(
+                'source__code', 'source__name',
+                'destination__code', 'destination__name',
+                'distance', 'created_at'
+            )
             context['routes'] = routes
         else:
             context['routes'] = Route.objects.none()
@@ -183,10 +217,10 @@ class ShortestRouteView(TemplateView):
         if shortest_route:
             # Get all routes with the same shortest distance
             shortest_distance = shortest_route.distance
-            # Optimize query with select_related
-            shortest_routes = Route.objects.filter(
+            # Load the airports in the same query
+            shortest_routes = Route.with_airports.filter(
                 distance=shortest_distance
-            ).select_related('source', 'destination').order_by('source__code', 'destination__code')
+            ).order_by('source__code', 'destination__code')
             
             context['shortest_route'] = shortest_route
             context['shortest_distance'] = shortest_distance
@@ -222,6 +256,20 @@ class AddAirportView(TemplateView):
                     f"Airport {airport.code} ({airport.name}) added successfully!"
                 )
                 return redirect('routes:add_airport')
+            except IntegrityError:
+                # Position already taken (rejected by the unique index)
+                position = form.cleaned_data['position']
+                existing = Airport.objects.filter(position=position).values_list('code', 'name').first()
+                if existing:
+                    code, name = existing
+                    form.add_error(
+                        'position',
+                        f'Position {position} is already taken by airport {code} ({name}). '
+                        f'Please choose a different position.'
+                    )
+                else:
+                    form.add_error(None, "This airport conflicts with an existing airport.")
+                messages.error(request, "Please correct the errors below.")
             except Exception as e:
                 messages.error(request, f"Error adding airport: {str(e)}")
         else:
@@ -239,10 +287,11 @@ class AirportListView(ListView):
     context_object_name = 'airports'
     ordering = ['position']
     paginate_by = 20
+    paginator_class = FasterAdminPaginator
     
     def get_queryset(self):
-        """Optimize queryset."""
-        return Airport.objects.all().order_by('position')
+        """Return airports in position order; every column is displayed, so none are deferred."""
+        return Airport.objects.order_by('position')
 
 
 class RouteListView(ListView):
@@ -252,10 +301,22 @@ class RouteListView(ListView):
     context_object_name = 'routes'
     ordering = ['-created_at']
     paginate_by = 20
+    paginator_class = FasterAdminPaginator
     
     def get_queryset(self):
-        """Optimize queryset with select_related."""
-        return Route.objects.select_related('source', 'destination').order_by('-created_at')
+        """Optimize queryset with select_related, selecting only the displayed columns."""
+        return Route.with_airports.only(
+            'id', 'distance', 'created_at',
+            'source__code', 'source__name',
+            'destination__code', 'destination__name',
+        ).order_by('-created_at')
+
+
+def _route_count_subquery(field_name):
+    """Count the routes whose ``field_name`` airport is the outer airport."""
+    routes = Route.objects.filter(**{field_name: OuterRef('pk')}).order_by()
+    count = routes.values(field_name).annotate(cnt=Count('pk')).values('cnt')
+    return Coalesce(Subquery(count), 0)
 
 
 @require_http_methods(["POST"])
@@ -265,13 +326,17 @@ def delete_airport(request, code):
     
     Prevents deletion if airport has associated routes.
     """
-    airport = get_object_or_404(Airport, code=code)
-    
-    # Check if airport has associated routes
-    outgoing_count = airport.outgoing_routes.count()
-    incoming_count = airport.incoming_routes.count()
-    total_routes = outgoing_count + incoming_count
-    
+    # Fetch the airport and its route counts in a single query; each count is
+    # a correlated subquery so the two directions are not joined together
+    airport = get_object_or_404(
+        Airport.objects.annotate(
+            out_cnt=_route_count_subquery('source'),
+            in_cnt=_route_count_subquery('destination'),
+        ),
+        code=code
+    )
+    total_routes = airport.out_cnt + airport.in_cnt
+
     if total_routes > 0:
         messages.error(
             request,
@@ -298,7 +363,7 @@ def delete_airport(request, code):
 @require_http_methods(["POST"])
 def delete_route(request, pk):
     """View for deleting a route."""
-    route = get_object_or_404(Route.objects.select_related('source', 'destination'), pk=pk)
+    route = get_object_or_404(Route.with_airports, pk=pk)
     
     try:
         with transaction.atomic():